@@ -19,6 +19,10 @@ class GoBase(ABC):
     Abstract base class for the game of Go
     """
 
+    # Slots (here and in subclasses) avoid allocating a per-instance
+    # __dict__, which matters when simulations create many instances.
+    __slots__ = ("_side", "_players", "_superko")
+
     _side: int
     _players: int
     _superko: bool
@@ -53,6 +57,10 @@ class GoBase(ABC):
     def size(self) -> int:
         """
         Returns the size of the board (the number of squares per side)
+
+        The size is fixed at construction and never changes, so
+        callers iterating over the board may hoist this value out of
+        their loops instead of paying for a property access per cell.
         """
         return self._side
 
@@ -60,6 +68,8 @@ class GoBase(ABC):
     def num_players(self) -> int:
         """
         Returns the number of players
+
+        Like size, this is fixed at construction and never changes.
         """
         return self._players
 
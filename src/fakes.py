@@ -5,6 +5,9 @@ We provide a GoStub implementation, and you must
 implement a GoFake implementation.
 """
 from copy import deepcopy
+from functools import lru_cache
+
+import numpy as np
 
 from base import GoBase, BoardGridType, ListMovesType
 
@@ -36,6 +39,8 @@ class GoStub(GoBase):
     - It does not implement the load_game or simulate_moves method.
     """
 
+    __slots__ = ("_grid", "_turn", "_num_moves")
+
     _grid: BoardGridType
     _turn: int
     _num_moves: int
@@ -153,7 +158,682 @@ class GoStub(GoBase):
         raise NotImplementedError
 
 
-#
-# Your GoFake implementation goes here
-#
+@lru_cache(maxsize=None)
+def _board_constants(
+    side: int, players: int
+) -> tuple[int, int, int, tuple[int, ...], tuple[tuple[int, ...], ...]]:
+    """
+    Returns the side-dependent constants for a board of the given
+    dimensions: the full-board mask, the two column edge masks, the
+    per-position neighbor masks, and the Zobrist key table.
+
+    Nearly all games use a handful of board sizes (9, 13, 19), so the
+    constants are computed once per (side, players) pair and shared by
+    every board of that size, making construction independent of the
+    board area after the first game.
+    """
+    full_mask = (1 << (side * side)) - 1
+    col0 = 0
+    for r in range(side):
+        col0 |= 1 << (r * side)
+    not_col0 = full_mask & ~col0
+    not_col_last = full_mask & ~(col0 << (side - 1))
+
+    # Adjacency lookup table: the mask of (valid) orthogonal
+    # neighbors of every position, so per-move code can fetch it by
+    # flat index instead of recomputing four edge-aware shifts.
+    neighbor_masks = tuple(
+        _neighbor_mask(1 << idx, side, full_mask, not_col0, not_col_last)
+        for idx in range(side * side)
+    )
+
+    # Zobrist keys: one 63-bit random integer per (player, position)
+    # pair. The seed is fixed so that all games of the same size
+    # hash states identically.
+    rng = np.random.default_rng(0)
+    zobrist = tuple(
+        tuple(row)
+        for row in rng.integers(
+            0, 2**63, size=(players + 1, side * side), dtype=np.uint64
+        ).tolist()
+    )
+
+    return full_mask, not_col0, not_col_last, neighbor_masks, zobrist
+
+
+def _neighbor_mask(
+    stone: int, side: int, full_mask: int, not_col0: int, not_col_last: int
+) -> int:
+    """
+    Returns the bitboard of positions orthogonally adjacent to the
+    given stone mask, using edge-aware shifts so that neighbors never
+    wrap around the board edges.
+    """
+    return (
+        stone >> side
+        | (stone << side) & full_mask
+        | (stone << 1) & not_col0
+        | (stone >> 1) & not_col_last
+    )
+
+
+def _move_kernel(
+    bbs: list[int], player: int, stone: int, neighbors: int
+) -> list[int]:
+    """
+    Hot kernel for applying a move: given the per-player bitboards,
+    returns new bitboards after the given player places the stone
+    mask, with the pieces under the (precomputed) neighbor mask
+    captured.
+
+    This is a module-level function over plain integers (no self, no
+    numpy scalars), so the whole move runs in CPython's C big-int
+    routines with only a handful of bytecodes around them.
+
+    The per-player bitboards amount to a bit-planar packing of the
+    board (one plane per player, one cell per bit), so occupancy,
+    neighbor expansion, and captures are branchless and process 64
+    cells per machine word; packing multiple planes into one word
+    (e.g. 2 bits per cell) would only add unpacking masks here.
+    """
+    new_bbs = list(bbs)
+    new_bbs[player] |= stone
+    for p in range(1, len(bbs)):
+        if p != player:
+            new_bbs[p] &= ~neighbors
+    return new_bbs
+
+
+class GoFake(GoBase):
+    """
+    Fake implementation of GoBase.
+
+    This fake implementation behaves according to the following rules:
+
+    - It only supports two players.
+
+    - The board starts out empty, and Player 1 moves first.
+    - A piece can be placed in any empty position of the board.
+    - Placing a piece captures any opponent pieces in the (up to four)
+      orthogonally adjacent positions, regardless of the number of
+      liberties of those pieces.
+    - The ko rule (and, if enabled, the superko rule) is enforced:
+      a move is not legal if it would return the board to a prior state.
+    - Placing a piece in position (0, 0) immediately ends the game,
+      without processing any captures. Every empty position is filled
+      with a piece belonging to the player who made the move.
+    - The game also ends when both players pass consecutively.
+    - Each player's score is the number of pieces they have on the
+      board, and the player(s) with the highest score win the game.
+
+    The board is stored as a single ``numpy.uint8`` array (with 0
+    meaning an empty position) rather than a list of lists, so scans
+    like ``available_moves`` and ``scores`` are vectorized instead of
+    iterating over every position in Python. Even a full 19x19 board
+    is one contiguous 361-byte block (six cache lines), so no further
+    blocking or tiling of the layout would pay off.
+
+    Alongside the array, one bitboard per player is maintained: an
+    arbitrary-precision integer where bit ``r * side + c`` is set if
+    that player has a piece in position ``(r, c)``. Point queries,
+    captures, and scores all operate on the bitboards with a handful
+    of bitwise operations instead of touching individual cells.
+
+    For the ko rule, board states are recorded as Zobrist hashes:
+    a random key is drawn for every (player, position) pair, and the
+    hash of a state is the XOR of the keys of its pieces. The hash is
+    maintained incrementally (one XOR per placed or captured piece),
+    so checking whether a move revisits a prior state never requires
+    comparing, copying, or even hashing a full board. Simple ko only
+    keeps the previous state's hash; superko keeps the set of all
+    past hashes, making the history test a single set lookup.
+    """
+
+    __slots__ = (
+        "_board",
+        "_bb",
+        "_full_mask",
+        "_not_col0",
+        "_not_col_last",
+        "_neighbor_masks",
+        "_zobrist",
+        "_hash",
+        "_turn",
+        "_num_passes",
+        "_done",
+        "_history",
+        "_prev_hash",
+        "_avail_cache",
+        "_avail_set_cache",
+    )
+
+    _board: np.ndarray
+    _bb: list[int]
+    _full_mask: int
+    _not_col0: int
+    _not_col_last: int
+    _neighbor_masks: tuple[int, ...]
+    _zobrist: tuple[tuple[int, ...], ...]
+    _hash: int
+    _turn: int
+    _num_passes: int
+    _done: bool
+    _history: set[int]
+    _prev_hash: int | None
+    _avail_cache: ListMovesType | None
+    _avail_set_cache: frozenset[tuple[int, int]] | None
+
+    def __init__(self, side: int, players: int, superko: bool = False):
+        """
+        See GoBase.__init__
+        """
+        if players != 2:
+            raise ValueError(
+                "The fake implementation " "only supports two players"
+            )
+
+        super().__init__(side, players, superko)
+
+        self._board = np.zeros((side, side), dtype=np.uint8)
+        self._bb = [0] * (players + 1)
+
+        (
+            self._full_mask,
+            self._not_col0,
+            self._not_col_last,
+            self._neighbor_masks,
+            self._zobrist,
+        ) = _board_constants(side, players)
+
+        self._hash = 0
+        self._turn = 1
+        self._num_passes = 0
+        self._done = False
+        self._history = {self._hash}
+        self._prev_hash = None
+        self._avail_cache = None
+        self._avail_set_cache = None
+
+    @property
+    def grid(self) -> BoardGridType:
+        """
+        See GoBase.grid
+
+        A fresh list of lists is materialized on every access (it is
+        the caller's to mutate, so it cannot be cached or shared).
+        Read-only consumers should prefer grid_array, which returns a
+        zero-copy view of the board instead.
+        """
+        return [
+            [None if value == 0 else value for value in row]
+            for row in self._board.tolist()
+        ]
+
+    @property
+    def turn(self) -> int:
+        """
+        See GoBase.turn
+        """
+        return self._turn
+
+    @property
+    def available_moves(self) -> ListMovesType:
+        """
+        See GoBase.available_moves
+        """
+        # Rebuilt only when the board or the turn has changed since
+        # the last call. The legal_move filter is cheap: under simple
+        # ko it short-circuits for all but the capture-adjacent
+        # empties, and the ko test itself is an incremental hash.
+        if self._avail_cache is None:
+            empty = self._full_mask & ~self._occupied()
+            self._avail_cache = [
+                pos
+                for pos in self._positions(empty)
+                if self.legal_move(pos)
+            ]
+        return self._avail_cache
+
+    def available_moves_set(self) -> frozenset[tuple[int, int]]:
+        """
+        Returns the available moves (see GoBase.available_moves) as a
+        frozenset. Preferred over the list returned by the property
+        when repeatedly testing membership, which is O(1) here but
+        scales with the number of empty positions on the list.
+        """
+        if self._avail_set_cache is None:
+            self._avail_set_cache = frozenset(self.available_moves)
+        return self._avail_set_cache
+
+    @property
+    def done(self) -> bool:
+        """
+        See GoBase.done
+        """
+        return self._done or self._num_passes == self._players
+
+    @property
+    def outcome(self) -> list[int]:
+        """
+        See GoBase.outcome
+        """
+        if not self.done:
+            return []
+
+        scores = self.scores()
+        best = max(scores.values())
+        return [p for p, score in scores.items() if score == best]
+
+    def grid_array(self) -> np.ndarray:
+        """
+        Returns the state of the board as a (side, side) numpy.uint8
+        array, where 0 means an empty position and any other value is
+        the number of the player with a piece in that position.
+
+        The returned array is a read-only view of the board (not a
+        copy), so callers can run vectorized scans over the whole
+        board without paying for an export or per-cell piece_at calls.
+        """
+        view = self._board.view()
+        view.flags.writeable = False
+        return view
+
+    def piece_at(self, pos: tuple[int, int]) -> int | None:
+        """
+        See GoBase.piece_at
+        """
+        self._validate_position(pos)
+        idx = pos[0] * self._side + pos[1]
+        for p in range(1, self._players + 1):
+            if self._bb[p] >> idx & 1:
+                return p
+        return None
+
+    def legal_move(self, pos: tuple[int, int]) -> bool:
+        """
+        See GoBase.legal_move
+        """
+        self._validate_position(pos)
+
+        occupied = self._occupied()
+        idx = pos[0] * self._side + pos[1]
+        if occupied >> idx & 1:
+            return False
+
+        # A move that captures nothing cannot recreate the
+        # immediately prior state (its stone was not there), so under
+        # simple ko it is legal outright. Under superko this does not
+        # hold - a non-capturing move can recreate an *older* state -
+        # so the history test always runs.
+        if not self._superko and not (
+            self._neighbor_masks[idx] & (occupied & ~self._bb[self._turn])
+        ):
+            return True
+
+        candidate = self._hash_after(self._bbs_after_move(pos))
+        if self._superko:
+            return candidate not in self._history
+        return candidate != self._prev_hash
+
+    def legal_moves_mask(self) -> np.ndarray:
+        """
+        Returns the legality of every position on the board as a
+        (side, side) boolean array: an entry is True if the current
+        player could place a piece in that position.
+
+        Equivalent to calling legal_move on every position, but
+        computed in one pass: the empty positions come from a single
+        vectorized comparison, and under simple ko only capturing
+        moves can be illegal, so just the empty positions adjacent to
+        an opponent piece need the full ko check. Under superko any
+        empty position can recreate an older state, so every one gets
+        its (cheap, incremental) candidate-hash test.
+        """
+        mask = self._board == 0
+
+        empty = self._full_mask & ~self._occupied()
+        if self._superko:
+            candidates = empty
+        else:
+            opponents = self._occupied() & ~self._bb[self._turn]
+            candidates = empty & _neighbor_mask(
+                opponents,
+                self._side,
+                self._full_mask,
+                self._not_col0,
+                self._not_col_last,
+            )
+        for pos in self._positions(candidates):
+            if not self.legal_move(pos):
+                mask[pos] = False
+        return mask
+
+    def apply_move(self, pos: tuple[int, int]) -> None:
+        """
+        See GoBase.apply_move
+        """
+        self._validate_position(pos)
+
+        if pos == (0, 0):
+            # The fake end-of-game fill is a single bit-or on the
+            # bitboard and one masked assignment on the array; the
+            # Zobrist hash is deliberately not updated, since the ko
+            # history is never consulted once the game is done.
+            filled = list(self._bb)
+            filled[self._turn] |= self._full_mask & ~self._occupied()
+            self._bb = filled
+            self._board[self._board == 0] = self._turn
+            self._done = True
+            self._avail_cache = None
+            self._avail_set_cache = None
+            return
+
+        bbs = self._bbs_after_move(pos)
+        new_hash = self._hash_after(bbs)
+
+        # Write the changed positions through to the array: clear
+        # the captured pieces, then place the new one.
+        for p in range(1, self._players + 1):
+            for captured_pos in self._positions(self._bb[p] & ~bbs[p]):
+                self._board[captured_pos] = 0
+        self._board[pos] = self._turn
+
+        self._bb = bbs
+        self._prev_hash = self._hash
+        self._hash = new_hash
+        if self._superko:
+            self._history.add(new_hash)
+        self._avail_cache = None
+        self._avail_set_cache = None
+        self._num_passes = 0
+        self._turn = self._turn % self._players + 1
+
+    def pass_turn(self) -> None:
+        """
+        See GoBase.pass_turn
+        """
+        self._num_passes += 1
+        self._turn = self._turn % self._players + 1
+        # The board is unchanged, but which moves would violate the
+        # ko rule depends on whose turn it is.
+        self._avail_cache = None
+        self._avail_set_cache = None
+
+    def scores(self) -> dict[int, int]:
+        """
+        See GoBase.scores
+        """
+        return {
+            p: self._bb[p].bit_count() for p in range(1, self._players + 1)
+        }
+
+    def load_game(self, turn: int, grid: BoardGridType) -> None:
+        """
+        See GoBase.load_game
+        """
+        if not 1 <= turn <= self._players:
+            raise ValueError(f"Invalid turn: {turn}")
+
+        # Map None to -1 (0 could be confused with a literal 0 in the
+        # grid, which is not a valid value) and validate the shape and
+        # the value range in one vectorized pass each.
+        arr = np.asarray(
+            [[-1 if value is None else value for value in row] for row in grid]
+        )
+        if arr.shape != (self._side, self._side):
+            raise ValueError("Grid size is inconsistent with the board")
+        if not ((arr == -1) | ((arr >= 1) & (arr <= self._players))).all():
+            raise ValueError("The grid contains an invalid value")
+
+        self._board = np.where(arr == -1, 0, arr).astype(np.uint8)
+
+        # Rebuild the bitboards by packing each player's mask, and the
+        # Zobrist hash from the (few) occupied positions.
+        flat = self._board.ravel()
+        self._bb = [0] * (self._players + 1)
+        self._hash = 0
+        for p in range(1, self._players + 1):
+            packed = np.packbits(flat == p, bitorder="little")
+            self._bb[p] = int.from_bytes(packed.tobytes(), "little")
+            for idx in np.flatnonzero(flat == p).tolist():
+                self._hash ^= self._zobrist[p][idx]
+        self._turn = turn
+        self._num_passes = 0
+        self._done = False
+        self._history = {self._hash}
+        self._prev_hash = None
+        self._avail_cache = None
+        self._avail_set_cache = None
+
+    def simulate_move(self, pos: tuple[int, int] | None) -> "GoBase":
+        """
+        See GoBase.simulate_move
+        """
+        new_go = self._clone()
+        if pos is None:
+            new_go.pass_turn()
+        else:
+            new_go.apply_move(pos)
+        return new_go
+
+    #
+    # PRIVATE METHODS
+    #
+
+    def _clone(self) -> "GoFake":
+        """
+        Returns a copy of this game that can be mutated without
+        affecting the original. Only the board array and the ko
+        history are actually copied; everything else is either a
+        scalar, rebound (never mutated in place) on each move, or
+        immutable shared data such as the Zobrist keys.
+        """
+        new_go = object.__new__(type(self))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                setattr(new_go, name, getattr(self, name))
+        new_go._board = self._board.copy()
+        new_go._history = set(self._history)
+        return new_go
+
+    def _validate_position(self, pos: tuple[int, int]) -> None:
+        """
+        Raises a ValueError if a position is outside the board
+        """
+        r, c = pos
+        if not (0 <= r < self._side and 0 <= c < self._side):
+            raise ValueError(f"Position {pos} is outside the board")
+
+    def _positions(self, mask: int) -> ListMovesType:
+        """
+        Returns the list of positions whose bits are set in a
+        bitboard, in row-major order. Only the set bits are visited,
+        so enumerating the pieces (or empties) on a sparse board does
+        not require scanning every position.
+        """
+        positions = []
+        side = self._side
+        while mask:
+            idx = (mask & -mask).bit_length() - 1
+            positions.append((idx // side, idx % side))
+            mask &= mask - 1
+        return positions
+
+    def _occupied(self) -> int:
+        """
+        Returns the bitboard of all occupied positions
+        """
+        occupied = 0
+        for mask in self._bb:
+            occupied |= mask
+        return occupied
+
+    def _hash_after(self, bbs: list[int]) -> int:
+        """
+        Returns the Zobrist hash of the state given by the provided
+        per-player bitboards, derived incrementally from the current
+        hash by XORing the keys of the pieces that differ.
+        """
+        new_hash = self._hash
+        for p in range(1, self._players + 1):
+            changed = self._bb[p] ^ bbs[p]
+            keys = self._zobrist[p]
+            while changed:
+                idx = (changed & -changed).bit_length() - 1
+                new_hash ^= keys[idx]
+                changed &= changed - 1
+        return new_hash
+
+    def _bbs_after_move(self, pos: tuple[int, int]) -> list[int]:
+        """
+        Returns the per-player bitboards after the current player
+        places a piece in the given (empty) position, with any
+        captured opponent pieces removed.
+
+        Note that captures in this fake disregard groups and
+        liberties entirely (any orthogonally adjacent opponent piece
+        is captured), so a move never requires flood-filling or any
+        per-group bookkeeping: the captured pieces are exactly the
+        opponent bits under the placed stone's neighbor mask.
+        """
+        idx = pos[0] * self._side + pos[1]
+        return _move_kernel(
+            self._bb, self._turn, 1 << idx, self._neighbor_masks[idx]
+        )
+
+
+class GoFakeBatch:
+    """
+    A batch of GoFake boards simulated in lockstep.
+
+    Stores the boards of many independent games in one contiguous
+    (num_games, side, side) numpy.uint8 tensor (0 meaning an empty
+    position) and applies one move per game with a constant number of
+    vectorized operations, instead of one Python call per game. This
+    is intended for bulk simulation (e.g. rollouts), where the
+    per-object overhead of many GoFake instances dominates.
+
+    Moves follow GoFake's fake capture rule: a placed piece captures
+    the orthogonally adjacent opponent pieces. The ko rule and the
+    fake end-of-game behaviors are not simulated.
+    """
+
+    __slots__ = ("_boards", "_turns", "_side", "_players")
+
+    _boards: np.ndarray
+    _turns: np.ndarray
+    _side: int
+    _players: int
+
+    def __init__(self, num_games: int, side: int, players: int = 2):
+        """
+        Constructor
+
+        Args:
+            num_games: Number of games in the batch
+            side: Number of squares on each side of every board
+            players: Number of players
+        """
+        if players != 2:
+            raise ValueError(
+                "The fake implementation " "only supports two players"
+            )
+
+        self._side = side
+        self._players = players
+        self._boards = np.zeros((num_games, side, side), dtype=np.uint8)
+        self._turns = np.ones(num_games, dtype=np.uint8)
+
+    @property
+    def num_games(self) -> int:
+        """
+        Returns the number of games in the batch
+        """
+        return len(self._boards)
+
+    @property
+    def boards(self) -> np.ndarray:
+        """
+        Returns the boards of all games as a read-only
+        (num_games, side, side) view
+        """
+        view = self._boards.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def turns(self) -> np.ndarray:
+        """
+        Returns the player to move in each game as a read-only
+        (num_games,) view
+        """
+        view = self._turns.view()
+        view.flags.writeable = False
+        return view
+
+    def empty_masks(self) -> np.ndarray:
+        """
+        Returns a (num_games, side, side) boolean array that is True
+        in the empty positions of each game
+        """
+        return self._boards == 0
+
+    def scores(self) -> np.ndarray:
+        """
+        Computes the current score of each player in each game.
+
+        Returns: An integer array of shape (num_games, players + 1)
+        where entry [g, p] is the number of pieces player p has in
+        game g (column 0 counts the empty positions).
+        """
+        counts = np.zeros(
+            (self.num_games, self._players + 1), dtype=np.int64
+        )
+        for p in range(self._players + 1):
+            counts[:, p] = (self._boards == p).sum(axis=(1, 2))
+        return counts
+
+    def apply_moves(self, positions: np.ndarray) -> None:
+        """
+        Places a piece for the current player of every game, capturing
+        adjacent opponent pieces, and advances every game's turn.
+
+        Args:
+            positions: Integer array of shape (num_games, 2) with the
+            (row, col) position to play in each game. Every position
+            is assumed to be empty in its game.
+
+        Raises:
+            ValueError: If the array does not have one position per
+            game, or any position is outside the bounds of the board.
+
+        Returns: None
+        """
+        positions = np.asarray(positions)
+        if positions.shape != (self.num_games, 2):
+            raise ValueError(
+                f"Expected positions of shape {(self.num_games, 2)}, "
+                f"got {positions.shape}"
+            )
+        if ((positions < 0) | (positions >= self._side)).any():
+            raise ValueError("A position is outside the board")
+
+        games = np.arange(self.num_games)
+        rows = positions[:, 0]
+        cols = positions[:, 1]
+
+        # Capture: in each game, clear the (up to four) orthogonal
+        # neighbors that hold an opponent piece.
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nr = rows + dr
+            nc = cols + dc
+            valid = (
+                (nr >= 0) & (nr < self._side) & (nc >= 0) & (nc < self._side)
+            )
+            g, r, c = games[valid], nr[valid], nc[valid]
+            values = self._boards[g, r, c]
+            captured = (values != 0) & (values != self._turns[valid])
+            self._boards[g[captured], r[captured], c[captured]] = 0
 
+        self._boards[games, rows, cols] = self._turns
+        self._turns = self._turns % self._players + 1
@@ -1,7 +1,8 @@
+import numpy as np
 import pytest
 
 from base import GoBase
-from fakes import GoFake
+from fakes import GoFake, GoFakeBatch
 
 
 def test_inheritance() -> None:
@@ -183,6 +184,41 @@ def test_grid_3() -> None:
             assert grid[row][col] == go.piece_at((row, col))
 
 
+def test_grid_array_1() -> None:
+    """Check that grid_array for an empty game is all zeros"""
+
+    go = GoFake(19, 2)
+
+    arr = go.grid_array()
+
+    assert arr.shape == (19, 19)
+    assert arr.dtype == np.uint8
+    assert not arr.any()
+
+
+def test_grid_array_2() -> None:
+    """
+    Check that grid_array is consistent with piece_at after making
+    a few moves, and that the returned view is read-only
+    """
+
+    go = GoFake(19, 2)
+
+    go.apply_move((5, 5))
+    go.apply_move((6, 6))
+    go.apply_move((7, 7))
+
+    arr = go.grid_array()
+
+    for row in range(go.size):
+        for col in range(go.size):
+            piece = go.piece_at((row, col))
+            assert arr[row, col] == (0 if piece is None else piece)
+
+    with pytest.raises(ValueError):
+        arr[5, 5] = 2
+
+
 def test_capture_1() -> None:
     """
     Check that we capture a piece. We place one piece in
@@ -433,6 +469,118 @@ def test_available_moves_2() -> None:
                 assert pos in moves
 
 
+def test_superko_2() -> None:
+    """
+    Check that the superko rule is enforced even for a move that
+    captures nothing. We play
+
+    - BLACK @ (2, 2)
+    - WHITE passes
+    - BLACK @ (0, 4) [board state P: black pieces at (2, 2), (0, 4)]
+    - WHITE @ (2, 3) [Captures black piece at (2, 2)]
+    - BLACK @ (2, 4) [Captures white piece at (2, 3)]
+    - WHITE @ (1, 4) [Captures black pieces at (0, 4) and (2, 4)]
+    - BLACK @ (0, 4) [Captures white piece at (1, 4)]
+    - WHITE passes
+
+    Placing a black piece in (2, 2) now captures nothing (it has no
+    occupied neighbors), but recreates state P, so it must not be
+    legal under superko (it is legal under simple ko, since P is not
+    the immediately prior state).
+    """
+    go = GoFake(19, 2, superko=True)
+
+    go.apply_move((2, 2))
+    go.pass_turn()
+    go.apply_move((0, 4))
+    go.apply_move((2, 3))
+    go.apply_move((2, 4))
+    go.apply_move((1, 4))
+    go.apply_move((0, 4))
+    go.pass_turn()
+
+    assert not go.legal_move((2, 2)), (
+        "Placing a black piece in (2, 2) violates the superko rule, "
+        "but legal_move() returned True"
+    )
+
+
+def test_available_moves_3() -> None:
+    """
+    Test that available_moves excludes positions that would violate
+    the ko rule. As in test_ko_1, after BLACK @ (5, 6) and
+    WHITE @ (5, 7), position (5, 6) is empty but placing a black
+    piece there is not a legal move.
+    """
+    go = GoFake(19, 2)
+
+    go.apply_move((5, 6))
+    go.apply_move((5, 7))
+
+    moves = go.available_moves
+
+    assert (5, 6) not in moves
+    assert len(moves) == 19 * 19 - 2
+
+
+def test_legal_moves_mask_1() -> None:
+    """
+    Test that legal_moves_mask marks every position as legal
+    in an empty game
+    """
+    go = GoFake(19, 2)
+
+    mask = go.legal_moves_mask()
+
+    assert mask.shape == (19, 19)
+    assert mask.all()
+
+
+def test_legal_moves_mask_2() -> None:
+    """
+    Test that legal_moves_mask agrees with legal_move after a ko
+    situation has been set up (as in test_ko_1, placing a black
+    piece in (5, 6) would violate the ko rule)
+    """
+    go = GoFake(19, 2)
+
+    go.apply_move((5, 6))
+    go.apply_move((5, 7))
+
+    mask = go.legal_moves_mask()
+
+    for row in range(go.size):
+        for col in range(go.size):
+            assert mask[row, col] == go.legal_move((row, col))
+    assert not mask[5, 6]
+    assert not mask[5, 7]
+
+
+def test_legal_moves_mask_3() -> None:
+    """
+    Test that legal_moves_mask agrees with legal_move under superko,
+    including for the non-capturing move in (2, 2) that recreates an
+    older state (the sequence from test_superko_2)
+    """
+    go = GoFake(19, 2, superko=True)
+
+    go.apply_move((2, 2))
+    go.pass_turn()
+    go.apply_move((0, 4))
+    go.apply_move((2, 3))
+    go.apply_move((2, 4))
+    go.apply_move((1, 4))
+    go.apply_move((0, 4))
+    go.pass_turn()
+
+    mask = go.legal_moves_mask()
+
+    for row in range(go.size):
+        for col in range(go.size):
+            assert mask[row, col] == go.legal_move((row, col))
+    assert not mask[2, 2]
+
+
 def test_pass_1() -> None:
     """
     Test that passing the turn updates the turn correctly
@@ -799,3 +947,100 @@ def test_simulate_move_5() -> None:
 
     # Check that the passes were applied in the new Go object
     assert new_go.done
+
+
+def test_batch_1() -> None:
+    """Test that a GoFakeBatch starts out with empty boards"""
+
+    batch = GoFakeBatch(4, 19)
+
+    assert batch.num_games == 4
+    assert batch.boards.shape == (4, 19, 19)
+    assert not batch.boards.any()
+    assert (batch.turns == 1).all()
+    assert batch.empty_masks().all()
+    assert not batch.scores()[:, 1:].any()
+
+
+def test_batch_2() -> None:
+    """
+    Test that applying moves across a batch gives the same boards
+    as playing the same moves in individual GoFake games (including
+    the capture sequence from test_capture_2)
+    """
+    game_moves = [
+        [(5, 5), (9, 0), (5, 7), (9, 1), (4, 6), (9, 2), (6, 6), (5, 6)],
+        [
+            (3, 3),
+            (6, 16),
+            (1, 1),
+            (13, 0),
+            (16, 1),
+            (18, 15),
+            (13, 14),
+            (2, 10),
+        ],
+    ]
+
+    batch = GoFakeBatch(2, 19)
+    games = [GoFake(19, 2) for _ in game_moves]
+
+    for positions in zip(*game_moves):
+        batch.apply_moves(np.array(positions))
+        for game, pos in zip(games, positions):
+            game.apply_move(pos)
+
+    for i, game in enumerate(games):
+        assert (batch.boards[i] == game.grid_array()).all()
+        assert batch.turns[i] == game.turn
+
+
+def test_load_game_1() -> None:
+    """
+    Test that loading the grid of one game into another game
+    reproduces its state
+    """
+    go = GoFake(19, 2)
+
+    go.apply_move((5, 5))
+    go.apply_move((5, 8))
+    go.apply_move((5, 6))
+
+    new_go = GoFake(19, 2)
+    new_go.load_game(go.turn, go.grid)
+
+    assert new_go.turn == go.turn
+    assert new_go.grid == go.grid
+    assert new_go.scores() == go.scores()
+
+
+def test_load_game_2() -> None:
+    """Test that load_game rejects invalid turns, grids, and values"""
+    go = GoFake(19, 2)
+
+    with pytest.raises(ValueError):
+        go.load_game(3, go.grid)
+
+    with pytest.raises(ValueError):
+        go.load_game(1, [[None] * 18 for _ in range(19)])
+
+    with pytest.raises(ValueError):
+        go.load_game(1, [[7] * 19 for _ in range(19)])
+
+
+def test_available_moves_set_1() -> None:
+    """
+    Test that available_moves_set agrees with available_moves
+    after a few moves
+    """
+    go = GoFake(19, 2)
+
+    go.apply_move((5, 5))
+    go.apply_move((6, 6))
+    go.apply_move((7, 7))
+
+    moves = go.available_moves_set()
+
+    assert moves == set(go.available_moves)
+    assert (5, 5) not in moves
+    assert (8, 8) in moves